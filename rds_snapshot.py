@@ -86,9 +86,10 @@ def check_sso_credentials(profile_name):
 
 def get_boto3_client(profile_name, region_name):
     """환경에 따른 AWS 클라이언트 생성"""
-    # EC2 환경인 경우
+    # EC2 환경인 경우 (기본 세션은 스레드 간 공유가 안전하지 않으므로 호출마다 세션 생성)
     if os.path.exists('/sys/hypervisor/uuid'):
-        return boto3.client('rds', region_name=region_name)
+        session = boto3.session.Session(region_name=region_name)
+        return session.client('rds')
 
     # 로컬 개발 환경인 경우
     else:
@@ -119,11 +120,9 @@ def check_aurora_cluster_state(rds, cluster_identifier):
         raise
 
 
-def create_aurora_snapshot(cluster_identifier):
+def create_aurora_snapshot(rds, cluster_identifier):
     """Aurora 클러스터의 수동 스냅샷 생성"""
     try:
-        rds = get_boto3_client()
-
         # 클러스터 상태 확인
         state = check_aurora_cluster_state(rds, cluster_identifier)
         if state != 'available':
@@ -182,11 +181,9 @@ def check_instance_state(rds, instance_identifier):
         raise
 
 
-def create_snapshot(instance_identifier):
+def create_snapshot(rds, instance_identifier):
     """RDS 인스턴스의 수동 스냅샷 생성"""
     try:
-        rds = get_boto3_client()
-
         # 인스턴스 상태 확인
         state = check_instance_state(rds, instance_identifier)
         if state != 'available':
@@ -232,17 +229,27 @@ def create_snapshot(instance_identifier):
         raise
 
 
+def get_allocated_storage_bytes(response, snapshots_key):
+    """스냅샷 응답의 할당 스토리지(GiB)를 바이트 단위로 반환
+
+    원본 볼륨의 할당 크기이며 실제 스냅샷 크기가 아니다 (Aurora는 보통 0).
+    """
+    snapshots = response.get(snapshots_key) or [{}]
+    allocated_gib = snapshots[0].get('AllocatedStorage')
+    if allocated_gib is None:
+        return None
+    return allocated_gib * 1024 ** 3
+
+
 def is_matching_snapshot_pattern(snapshot_id, instance_identifier):
     """스냅샷 ID가 지정된 패턴과 일치하는지 확인"""
     pattern = f"^{instance_identifier}-\\d{{4}}-\\d{{2}}-\\d{{2}}-[A-Za-z0-9]{{8}}$"
     return bool(re.match(pattern, snapshot_id))
 
 
-def delete_old_snapshots(instance_identifier, months=3):
+def delete_old_snapshots(rds, instance_identifier, months=3):
     """지정된 패턴의 3개월 이상 된 수동 스냅샷 삭제"""
     try:
-        rds = get_boto3_client()
-
         cutoff_date = datetime.now() - timedelta(days=months * 30)
 
         print("\n오래된 스냅샷 검색 중...")
@@ -295,11 +302,9 @@ def delete_old_snapshots(instance_identifier, months=3):
         raise
 
 
-def delete_old_aurora_snapshots(cluster_identifier, months=3):
+def delete_old_aurora_snapshots(rds, cluster_identifier, months=3):
     """오래된 Aurora 클러스터 스냅샷 삭제"""
     try:
-        rds = get_boto3_client()
-
         cutoff_date = datetime.now() - timedelta(days=months * 30)
 
         print("\n오래된 Aurora 스냅샷 검색 중...")
@@ -348,8 +353,12 @@ def delete_old_aurora_snapshots(cluster_identifier, months=3):
         raise
 
 
-def process_instance(instance):
-    """DB 인스턴스 처리 (RDS 또는 Aurora)"""
+def process_instance(instance, run_info=None):
+    """DB 인스턴스 처리 (RDS 또는 Aurora)
+
+    run_info 딕셔너리를 넘기면 스냅샷 생성 소요 시간(snapshot_seconds)과 할당 스토리지(allocated_storage_bytes)를 채워주고,
+    스냅샷을 생성하지 않은 경우 outcome을 'skipped'로 표시한다.
+    """
     try:
         instance_id = instance['identifier']
         instance_type = instance['type']
@@ -365,16 +374,28 @@ def process_instance(instance):
         # 인스턴스별 AWS 클라이언트 생성
         rds = get_boto3_client(aws_profile, aws_region)
 
+        snapshot_response = None
         if instance_type == 'aurora':
             if check_aurora_cluster_state(rds, instance_id) == 'available':
-                snapshot_response = create_aurora_snapshot(instance_id)
+                snapshot_started_at = datetime.now()
+                snapshot_response = create_aurora_snapshot(rds, instance_id)
                 if snapshot_response is not None:
-                    delete_old_aurora_snapshots(instance_id, retention_months)
+                    if run_info is not None:
+                        run_info['snapshot_seconds'] = (datetime.now() - snapshot_started_at).total_seconds()
+                        run_info['allocated_storage_bytes'] = get_allocated_storage_bytes(snapshot_response, 'DBClusterSnapshots')
+                    delete_old_aurora_snapshots(rds, instance_id, retention_months)
         else:  # rds
             if check_instance_state(rds, instance_id) == 'available':
-                snapshot_response = create_snapshot(instance_id)
+                snapshot_started_at = datetime.now()
+                snapshot_response = create_snapshot(rds, instance_id)
                 if snapshot_response is not None:
-                    delete_old_snapshots(instance_id, retention_months)
+                    if run_info is not None:
+                        run_info['snapshot_seconds'] = (datetime.now() - snapshot_started_at).total_seconds()
+                        run_info['allocated_storage_bytes'] = get_allocated_storage_bytes(snapshot_response, 'DBSnapshots')
+                    delete_old_snapshots(rds, instance_id, retention_months)
+
+        if snapshot_response is None and run_info is not None:
+            run_info['outcome'] = 'skipped'
 
         print(f"[{instance_id}] 인스턴스 처리 완료")
         return True
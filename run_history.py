@@ -0,0 +1,133 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+
+REQUIRED_KEYS = ('task', 'instance', 'started_at', 'outcome')
+
+
+class RunHistory:
+    """작업 실행 이력 저장소 (JSON Lines 파일)"""
+
+    def __init__(self, path: str = 'run_history.jsonl', sample_size: int = 5):
+        self.path = path
+        self.sample_size = sample_size
+        self.logger = logging.getLogger('RunHistory')
+        self._lock = threading.Lock()
+        self._records = self._load()
+
+    def _load(self) -> List[Dict[str, Any]]:
+        """이력 파일 로드"""
+        records = []
+        if not os.path.exists(self.path):
+            return records
+
+        # 깨진 바이트가 있어도 시작을 막지 않도록 대체 문자로 읽고, 해당 행은 아래에서 걸러낸다
+        with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    entry = None
+
+                if not isinstance(entry, dict) or not all(key in entry for key in REQUIRED_KEYS):
+                    self.logger.warning(f"실행 이력 {self.path}:{line_no} 행을 읽을 수 없어 건너뜁니다.")
+                    continue
+                records.append(entry)
+
+        self.logger.info(f"실행 이력 로드 완료: {self.path} ({len(records)}건)")
+        return records
+
+    def record(
+            self,
+            task_name: str,
+            instance_id: Optional[str],
+            started_at: datetime,
+            ended_at: datetime,
+            outcome: str,
+            snapshot_seconds: Optional[float] = None,
+            allocated_storage_bytes: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """실행 결과 1건 기록 (파일 기록 실패 시 로그만 남기고 None 반환)"""
+        entry = {
+            'task': task_name,
+            'instance': instance_id,
+            'started_at': started_at.isoformat(),
+            'ended_at': ended_at.isoformat(),
+            'duration_seconds': round((ended_at - started_at).total_seconds(), 3),
+            'snapshot_seconds': round(snapshot_seconds, 3) if snapshot_seconds is not None else None,
+            'allocated_storage_bytes': allocated_storage_bytes,
+            'outcome': outcome
+        }
+
+        with self._lock:
+            try:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            except OSError as e:
+                self.logger.error(f"실행 이력 기록 중 오류 발생 ({self.path}): {str(e)}")
+                return None
+            self._records.append(entry)
+
+        return entry
+
+    def get_runs(self, task_name: Optional[str] = None, instance_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """조건에 맞는 실행 이력 반환 (오래된 순)"""
+        with self._lock:
+            return [
+                entry for entry in self._records
+                if (task_name is None or entry['task'] == task_name)
+                and (instance_id is None or entry['instance'] == instance_id)
+            ]
+
+    def last_run(self, task_name: str) -> Optional[datetime]:
+        """작업의 마지막 실행 시작 시각 반환 (작업 단위 기록 기준)"""
+        started_times = []
+        for entry in self.get_runs(task_name):
+            if entry['instance'] is not None:
+                continue
+            try:
+                started_times.append(datetime.fromisoformat(entry['started_at']))
+            except (TypeError, ValueError):
+                continue
+
+        return max(started_times) if started_times else None
+
+    def predict_duration(self, task_name: str, instance_id: Optional[str], default: float) -> float:
+        """최근 성공 이력의 평균으로 인스턴스 처리 소요 시간(초) 예측
+
+        실행 슬롯은 보관 기간 정리까지 점유되므로 전체 처리 시간(duration_seconds)을 사용하되,
+        스냅샷을 실제로 생성한(snapshot_seconds가 있는) 실행만 반영한다.
+        """
+        durations = [
+            entry['duration_seconds'] for entry in self.get_runs(task_name, instance_id)
+            if entry['outcome'] == 'success'
+            and isinstance(entry.get('snapshot_seconds'), (int, float))
+            and isinstance(entry.get('duration_seconds'), (int, float))
+        ][-self.sample_size:]
+
+        if not durations:
+            return default
+        return sum(durations) / len(durations)
+
+
+def plan_schedule(durations: Dict[str, float], max_concurrency: int) -> Tuple[List[Tuple[str, float]], float]:
+    """예상 소요 시간이 긴 순서로 슬롯에 배치 (LPT)
+
+    각 인스턴스의 (식별자, 예상 시작 오프셋 초) 목록과 전체 예상 소요 시간(초)을 반환한다.
+    """
+    slots = [0.0] * max(1, max_concurrency)
+    plan = []
+
+    for instance_id, duration in sorted(durations.items(), key=lambda item: item[1], reverse=True):
+        slot = slots.index(min(slots))
+        plan.append((instance_id, slots[slot]))
+        slots[slot] += duration
+
+    return plan, max(slots)
@@ -7,6 +7,8 @@ import yaml
 import os
 import importlib
 from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from run_history import RunHistory, plan_schedule
 
 class Task:
     """작업 클래스"""
@@ -18,7 +20,12 @@ class Task:
             args: tuple = (),
             kwargs: dict = None,
             enabled: bool = True,
-            description: str = ""
+            description: str = "",
+            history: Optional[RunHistory] = None,
+            instances: Optional[List[Dict[str, Any]]] = None,
+            max_concurrency: int = 1,
+            window_minutes: Optional[int] = None,
+            default_duration_minutes: int = 30
     ):
         self.name = name
         self.func = func
@@ -26,7 +33,12 @@ class Task:
         self.kwargs = kwargs or {}
         self.enabled = enabled
         self.description = description
-        self.last_run = None
+        self.history = history
+        self.instances = instances
+        self.max_concurrency = max(1, max_concurrency)
+        self.window_minutes = window_minutes
+        self.default_duration_minutes = default_duration_minutes
+        self.last_run = history.last_run(name) if history else None
         self.next_run = None
 
     def run(self):
@@ -35,13 +47,115 @@ class Task:
             logging.info(f"작업 {self.name}이 비활성화되어 있습니다.")
             return
 
+        if self.instances is not None:
+            self._run_instances()
+            return
+
+        started_at = datetime.now()
+        outcome = 'success'
         try:
             logging.info(f"작업 {self.name} 실행 시작")
-            self.last_run = datetime.now()
-            self.func(*self.args, **self.kwargs)
-            logging.info(f"작업 {self.name} 실행 완료")
+            self.last_run = started_at
+            outcome = self._get_outcome(self.func(*self.args, **self.kwargs))
+            logging.info(f"작업 {self.name} 실행 완료 (결과: {outcome})")
         except Exception as e:
+            outcome = 'failed'
             logging.error(f"작업 {self.name} 실행 중 오류 발생: {str(e)}", exc_info=True)
+        finally:
+            if self.history:
+                self.history.record(self.name, None, started_at, datetime.now(), outcome)
+
+    def _run_instances(self):
+        """인스턴스별 작업 실행 (예상 소요 시간이 긴 인스턴스부터 시작)"""
+        instances = {}
+        for instance in self.instances:
+            instance_key = self._instance_key(instance)
+            if instance_key in instances:
+                logging.error(f"작업 {self.name}에 중복된 인스턴스 {instance_key}가 있어 한 번만 실행합니다.")
+                continue
+            instances[instance_key] = instance
+
+        default_duration = self.default_duration_minutes * 60
+        durations = {
+            instance_id: self.history.predict_duration(self.name, instance_id, default_duration)
+            if self.history else default_duration
+            for instance_id in instances
+        }
+
+        plan, makespan = plan_schedule(durations, self.max_concurrency)
+        logging.info(
+            f"작업 {self.name} 실행 시작 (인스턴스 {len(plan)}개, 동시 실행 {self.max_concurrency}개, "
+            f"예상 소요 {makespan / 60:.1f}분)"
+        )
+        for instance_id, offset in plan:
+            logging.info(
+                f"- {instance_id}: 예상 소요 {durations[instance_id] / 60:.1f}분, 예상 시작 +{offset / 60:.1f}분"
+            )
+
+        if self.window_minutes and makespan > self.window_minutes * 60:
+            logging.warning(
+                f"작업 {self.name}의 예상 소요 시간({makespan / 60:.1f}분)이 "
+                f"백업 윈도우({self.window_minutes}분)를 초과합니다. max_concurrency 조정이 필요합니다."
+            )
+
+        started_at = datetime.now()
+        self.last_run = started_at
+        # 제출 순서대로 빈 슬롯에 배정되므로 긴 작업이 먼저 시작된다
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = {
+                instance_id: executor.submit(self._run_instance, instances[instance_id])
+                for instance_id, _ in plan
+            }
+
+        outcome = 'success'
+        for instance_id, future in futures.items():
+            try:
+                if future.result() == 'failed':
+                    outcome = 'failed'
+            except Exception as e:
+                outcome = 'failed'
+                logging.error(f"작업 {self.name} [{instance_id}] 실행 이력 기록 중 오류 발생: {str(e)}", exc_info=True)
+
+        ended_at = datetime.now()
+        logging.info(
+            f"작업 {self.name} 실행 완료 (결과: {outcome}, 소요 {(ended_at - started_at).total_seconds() / 60:.1f}분)"
+        )
+        # 작업 단위 기록 (재시작 후 last_run 복원용)
+        if self.history:
+            self.history.record(self.name, None, started_at, ended_at, outcome)
+
+    @staticmethod
+    def _get_outcome(result: Any, run_info: Optional[Dict[str, Any]] = None) -> str:
+        """함수 반환값으로 실행 결과 판정 (False는 실패, run_info의 outcome 우선)"""
+        if result is False:
+            return 'failed'
+        return (run_info or {}).get('outcome', 'success')
+
+    @staticmethod
+    def _instance_key(instance: Dict[str, Any]) -> str:
+        """인스턴스 식별 키 (식별자는 계정/리전 내에서만 고유하므로 프로필/리전 포함)"""
+        return '/'.join(str(instance.get(key) or '') for key in ('aws_profile', 'aws_region', 'identifier'))
+
+    def _run_instance(self, instance: Dict[str, Any]) -> str:
+        """단일 인스턴스 작업 실행 및 이력 기록, 실행 결과 반환"""
+        instance_id = self._instance_key(instance)
+        run_info = {}
+        started_at = datetime.now()
+        outcome = 'success'
+        try:
+            outcome = self._get_outcome(self.func(instance, *self.args, run_info=run_info, **self.kwargs), run_info)
+        except Exception as e:
+            outcome = 'failed'
+            logging.error(f"작업 {self.name} [{instance_id}] 실행 중 오류 발생: {str(e)}", exc_info=True)
+        finally:
+            if self.history:
+                self.history.record(
+                    self.name, instance_id, started_at, datetime.now(), outcome,
+                    snapshot_seconds=run_info.get('snapshot_seconds'),
+                    allocated_storage_bytes=run_info.get('allocated_storage_bytes')
+                )
+
+        return outcome
 
 
 class TaskScheduler:
@@ -55,6 +169,14 @@ class TaskScheduler:
         self.config_path = config_path
         self.config = self.load_config()
 
+        # 실행 이력 저장소
+        history_config = (self.config or {}).get('history', {})
+        self.history = RunHistory(
+            history_config.get('file', 'run_history.jsonl'),
+            history_config.get('sample_size', 5)
+        )
+        self.default_duration_minutes = history_config.get('default_duration_minutes', 30)
+
         # 설정 파일에서 작업 자동 등록
         self.register_tasks_from_config()
 
@@ -93,6 +215,9 @@ class TaskScheduler:
                 'rds_backup': {
                     'module': 'rds_snapshot',
                     'function': 'process_instance',
+                    'instances': 'DB_INSTANCES',
+                    'max_concurrency': 2,
+                    'window_minutes': 180,
                     'args': [],
                     'kwargs': {},
                     'schedule': {
@@ -103,6 +228,11 @@ class TaskScheduler:
                     'description': 'RDS 백업 작업'
                 }
             },
+            'history': {
+                'file': 'run_history.jsonl',
+                'sample_size': 5,
+                'default_duration_minutes': 30
+            },
             'logging': {
                 'level': 'INFO',
                 'file': 'scheduler.log'
@@ -139,6 +269,15 @@ class TaskScheduler:
                     self.logger.error(f"모듈 {module_name}의 함수 {function_name} 임포트 중 오류: {str(e)}")
                     continue
 
+                # 인스턴스 목록 가져오기 (모듈 변수명)
+                instances = None
+                instances_name = task_config.get('instances')
+                if instances_name:
+                    instances = getattr(module, instances_name, None)
+                    if not isinstance(instances, list):
+                        self.logger.error(f"모듈 {module_name}에 인스턴스 목록 {instances_name}이 없습니다.")
+                        continue
+
                 # 스케줄 정보 가져오기
                 schedule_config = task_config.get('schedule', {})
                 schedule_type = schedule_config.get('type')
@@ -158,7 +297,10 @@ class TaskScheduler:
                     args=task_config.get('args', []),
                     kwargs=task_config.get('kwargs', {}),
                     enabled=task_config.get('enabled', True),
-                    description=task_config.get('description', '')
+                    description=task_config.get('description', ''),
+                    instances=instances,
+                    max_concurrency=task_config.get('max_concurrency', 1),
+                    window_minutes=task_config.get('window_minutes')
                 )
 
             except Exception as e:
@@ -173,10 +315,20 @@ class TaskScheduler:
             args: tuple = (),
             kwargs: dict = None,
             enabled: bool = True,
-            description: str = ""
+            description: str = "",
+            instances: Optional[List[Dict[str, Any]]] = None,
+            max_concurrency: int = 1,
+            window_minutes: Optional[int] = None
     ):
         """작업 추가"""
-        task = Task(name, func, args, kwargs, enabled, description)
+        task = Task(
+            name, func, args, kwargs, enabled, description,
+            history=self.history,
+            instances=instances,
+            max_concurrency=max_concurrency,
+            window_minutes=window_minutes,
+            default_duration_minutes=self.default_duration_minutes
+        )
         self.tasks[name] = task
 
         schedule_func = self._get_schedule_function(schedule_type, schedule_time)
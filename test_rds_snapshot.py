@@ -0,0 +1,72 @@
+import importlib
+import os
+from datetime import datetime
+
+import pytest
+
+
+class FakeRds:
+    """process_instance가 사용하는 RDS API만 흉내 내는 가짜 클라이언트"""
+
+    def __init__(self, state='available'):
+        self.state = state
+        self.created = []
+
+    def describe_db_instances(self, DBInstanceIdentifier):
+        return {'DBInstances': [{'DBInstanceStatus': self.state}]}
+
+    def create_db_snapshot(self, DBSnapshotIdentifier, DBInstanceIdentifier):
+        self.created.append(DBSnapshotIdentifier)
+        return {}
+
+    def describe_db_snapshots(self, DBSnapshotIdentifier=None, DBInstanceIdentifier=None, SnapshotType=None):
+        return {'DBSnapshots': [{
+            'DBSnapshotIdentifier': DBSnapshotIdentifier or self.created[-1],
+            'Status': 'available',
+            'AllocatedStorage': 20,
+            'SnapshotCreateTime': datetime.now()
+        }]}
+
+
+@pytest.fixture
+def rds_snapshot(monkeypatch):
+    # 모듈 로드 시 현재 디렉터리의 snapshot_config.yml을 읽는다
+    monkeypatch.chdir(os.path.dirname(os.path.abspath(__file__)))
+    return importlib.import_module('rds_snapshot')
+
+
+@pytest.fixture
+def instance():
+    return {
+        'identifier': 'dev-db',
+        'type': 'rds',
+        'retention_months': 1,
+        'aws_profile': 'AdminRole-111111111111',
+        'aws_region': 'ap-northeast-2'
+    }
+
+
+def test_process_instance_fills_run_info(rds_snapshot, instance, monkeypatch):
+    rds = FakeRds()
+    clients = []
+    monkeypatch.setattr(rds_snapshot, 'get_boto3_client', lambda *args: clients.append(args) or rds)
+
+    run_info = {}
+    assert rds_snapshot.process_instance(instance, run_info=run_info) is True
+
+    assert clients == [('AdminRole-111111111111', 'ap-northeast-2')]
+    assert len(rds.created) == 1
+    assert run_info['allocated_storage_bytes'] == 20 * 1024 ** 3
+    assert run_info['snapshot_seconds'] >= 0
+    assert 'outcome' not in run_info
+
+
+def test_process_instance_marks_skipped(rds_snapshot, instance, monkeypatch):
+    rds = FakeRds(state='stopped')
+    monkeypatch.setattr(rds_snapshot, 'get_boto3_client', lambda *args: rds)
+
+    run_info = {}
+    assert rds_snapshot.process_instance(instance, run_info=run_info) is True
+
+    assert rds.created == []
+    assert run_info == {'outcome': 'skipped'}
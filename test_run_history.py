@@ -0,0 +1,80 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from run_history import RunHistory, plan_schedule
+
+
+START = datetime(2024, 1, 1, 2, 0)
+
+
+def record_snapshot(history, instance_id, seconds, outcome='success'):
+    history.record(
+        'rds_backup', instance_id, START, START + timedelta(seconds=seconds + 60), outcome,
+        snapshot_seconds=seconds if outcome == 'success' else None
+    )
+
+
+def test_predict_duration_uses_last_successful_runs(tmp_path):
+    history = RunHistory(str(tmp_path / 'history.jsonl'), sample_size=3)
+    for seconds in (1000, 100, 200):
+        record_snapshot(history, 'db-1', seconds)
+    record_snapshot(history, 'db-1', 5, outcome='skipped')
+    record_snapshot(history, 'db-1', 5, outcome='failed')
+    record_snapshot(history, 'db-1', 300)
+
+    # 스냅샷 생성 시간이 아니라 보관 기간 정리를 포함한 전체 처리 시간(+60초)을 사용
+    assert history.predict_duration('rds_backup', 'db-1', default=60) == pytest.approx(260)
+
+
+def test_predict_duration_default_without_history(tmp_path):
+    history = RunHistory(str(tmp_path / 'history.jsonl'))
+    record_snapshot(history, 'db-1', 5, outcome='skipped')
+
+    assert history.predict_duration('rds_backup', 'db-1', default=1800) == 1800
+    assert history.predict_duration('rds_backup', 'db-2', default=1800) == 1800
+
+
+def test_plan_schedule_longest_first():
+    plan, makespan = plan_schedule({'a': 3, 'b': 5, 'c': 4, 'd': 2}, max_concurrency=2)
+
+    assert plan == [('b', 0.0), ('c', 0.0), ('a', 4.0), ('d', 5.0)]
+    assert makespan == 7.0
+
+
+def test_load_skips_malformed_lines(tmp_path):
+    path = tmp_path / 'history.jsonl'
+    valid = {
+        'task': 'rds_backup', 'instance': None, 'started_at': START.isoformat(),
+        'ended_at': START.isoformat(), 'duration_seconds': 1.0, 'outcome': 'success'
+    }
+    path.write_text('\n'.join([
+        'not json',
+        '[1, 2]',
+        json.dumps({'task': 'rds_backup'}),
+        json.dumps(dict(valid, started_at='bad')),
+        json.dumps(valid),
+    ]) + '\n', encoding='utf-8')
+
+    history = RunHistory(str(path))
+
+    assert len(history.get_runs()) == 2
+    assert history.last_run('rds_backup') == START
+
+
+def test_record_write_failure_is_logged(tmp_path):
+    history = RunHistory(str(tmp_path / 'missing' / 'history.jsonl'))
+
+    assert history.record('rds_backup', None, START, START, 'success') is None
+    assert history.get_runs() == []
+
+
+def test_load_skips_invalid_utf8(tmp_path):
+    path = tmp_path / 'history.jsonl'
+    valid = {'task': 'rds_backup', 'instance': None, 'started_at': START.isoformat(), 'outcome': 'success'}
+    path.write_bytes(b'\xff\xfe{broken\n' + json.dumps(valid).encode('utf-8') + b'\n')
+
+    history = RunHistory(str(path))
+
+    assert len(history.get_runs()) == 1
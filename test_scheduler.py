@@ -0,0 +1,145 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import schedule
+import yaml
+
+from run_history import RunHistory
+from scheduler import Task, TaskScheduler
+
+
+START = datetime(2024, 1, 1, 2, 0)
+
+
+def make_instance(identifier, region='ap-northeast-2'):
+    return {'identifier': identifier, 'aws_profile': 'default', 'aws_region': region}
+
+
+def seed_duration(history, instance, seconds):
+    key = Task._instance_key(instance)
+    history.record('rds_backup', key, START, START + timedelta(seconds=seconds), 'success', snapshot_seconds=seconds)
+
+
+class FakeFunc:
+    """호출 순서와 동시 실행 수를 기록하는 가짜 작업 함수"""
+
+    def __init__(self, outcomes=None, delay=0.0):
+        self.outcomes = outcomes or {}
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, instance, run_info=None):
+        with self._lock:
+            self.calls.append(instance['identifier'])
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+
+        outcome = self.outcomes.get(instance['identifier'], 'success')
+        if outcome == 'failed':
+            return False
+        if outcome == 'skipped':
+            run_info['outcome'] = 'skipped'
+            return True
+        run_info['snapshot_seconds'] = self.delay
+        return True
+
+
+@pytest.fixture
+def history(tmp_path):
+    return RunHistory(str(tmp_path / 'history.jsonl'))
+
+
+def test_run_instances_longest_first(history):
+    instances = [make_instance('small'), make_instance('large'), make_instance('medium')]
+    for instance, seconds in zip(instances, (100, 900, 500)):
+        seed_duration(history, instance, seconds)
+
+    func = FakeFunc()
+    Task('rds_backup', func, history=history, instances=instances, max_concurrency=1).run()
+
+    assert func.calls == ['large', 'medium', 'small']
+
+
+def test_run_instances_respects_max_concurrency(history):
+    instances = [make_instance(f'db-{i}') for i in range(5)]
+
+    func = FakeFunc(delay=0.05)
+    Task('rds_backup', func, history=history, instances=instances, max_concurrency=2).run()
+
+    assert sorted(func.calls) == [f'db-{i}' for i in range(5)]
+    assert func.max_running == 2
+
+
+@pytest.mark.parametrize('outcomes, expected', [
+    ({'db-1': 'skipped'}, 'success'),
+    ({'db-1': 'skipped', 'db-2': 'failed'}, 'failed'),
+])
+def test_instance_outcomes_roll_up(history, outcomes, expected):
+    instances = [make_instance('db-1'), make_instance('db-2'), make_instance('db-3')]
+
+    Task('rds_backup', FakeFunc(outcomes), history=history, instances=instances).run()
+
+    recorded = {entry['instance']: entry['outcome'] for entry in history.get_runs('rds_backup')}
+    for instance in instances:
+        assert recorded[Task._instance_key(instance)] == outcomes.get(instance['identifier'], 'success')
+    assert recorded[None] == expected
+
+
+def test_duplicate_instances_run_once(history):
+    instances = [
+        make_instance('db-1'),
+        make_instance('db-1'),
+        make_instance('db-1', region='ap-northeast-1'),
+    ]
+
+    func = FakeFunc()
+    Task('rds_backup', func, history=history, instances=instances).run()
+
+    assert func.calls == ['db-1', 'db-1']
+    keys = {entry['instance'] for entry in history.get_runs('rds_backup') if entry['instance']}
+    assert keys == {'default/ap-northeast-2/db-1', 'default/ap-northeast-1/db-1'}
+
+
+def test_plain_task_false_is_failed(history):
+    Task('cleanup', lambda: False, history=history).run()
+
+    assert history.get_runs('cleanup')[0]['outcome'] == 'failed'
+
+
+def test_run_survives_history_write_failure(tmp_path):
+    history = RunHistory(str(tmp_path / 'missing' / 'history.jsonl'))
+
+    Task('rds_backup', FakeFunc(), history=history, instances=[make_instance('db-1')]).run()
+    Task('cleanup', lambda: None, history=history).run()
+
+
+def test_scheduler_restores_last_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = {
+        'tasks': {
+            'cleanup': {
+                'module': 'os',
+                'function': 'getcwd',
+                'schedule': {'type': 'interval', 'minutes': 60}
+            }
+        },
+        'history': {'file': 'history.jsonl'}
+    }
+    (tmp_path / 'scheduler_config.yml').write_text(yaml.dump(config), encoding='utf-8')
+    history = RunHistory(str(tmp_path / 'history.jsonl'))
+    history.record('cleanup', None, START, START + timedelta(seconds=5), 'success')
+    history.record('cleanup', 'default/ap-northeast-2/db-1', START + timedelta(hours=1), START, 'success')
+
+    try:
+        scheduler = TaskScheduler('scheduler_config.yml')
+        assert scheduler.list_tasks()[0]['last_run'] == START
+    finally:
+        schedule.clear()